@@ -2,6 +2,7 @@
 Video player in the courseware.
 """
 
+import re
 import time
 import requests
 from selenium.webdriver.common.action_chains import ActionChains
@@ -50,6 +51,9 @@ VIDEO_MENUS = {
     'transcript-format': '.video-tracks .a11y-menu-button'
 }
 
+# Same ranges as `time.strptime(time_str, '%M:%S')`: minutes 0-59, seconds 0-61.
+TIME_STR_RE = re.compile(r'^([0-5]\d|\d):(6[0-1]|[0-5]\d|\d)\Z')
+
 
 @js_defined('window.Video', 'window.RequireJS.require', 'window.jQuery')
 class VideoPage(PageObject):
@@ -60,6 +64,30 @@ class VideoPage(PageObject):
     url = None
     current_video_display_name = None
 
+    def __init__(self, browser):
+        super(VideoPage, self).__init__(browser)
+        # HTTP session shared by transcript downloads, created on first download.
+        self._http = None
+        self._vert_index = 0
+        self._sel = self._build_selectors()
+
+    def _build_selectors(self):
+        """
+        Precompute element selectors for the current video.
+
+        Keys of CSS_CLASS_NAMES are used as is, keys of VIDEO_BUTTONS and VIDEO_MENUS
+        are prefixed with `button.` and `menu.` respectively.
+
+        Returns:
+            dict: Element selectors scoped to the current video vertical.
+
+        """
+        selectors = {}
+        for prefix, class_names in (('', CSS_CLASS_NAMES), ('button.', VIDEO_BUTTONS), ('menu.', VIDEO_MENUS)):
+            for key, class_name in class_names.items():
+                selectors[prefix + key] = self.get_element_selector(class_name)
+        return selectors
+
     @wait_for_js
     def is_browser_on_page(self):
         return self.q(css='div{0}'.format(CSS_CLASS_NAMES['video_xmodule'])).present
@@ -86,8 +114,49 @@ class VideoPage(PageObject):
         self.wait_for_element_presence(CSS_CLASS_NAMES['video_time'], 'Video Player Initialized')
 
         video_player_buttons = ['volume', 'play', 'fullscreen', 'speed']
-        for button in video_player_buttons:
-            self.wait_for_element_visibility(VIDEO_BUTTONS[button], '{} button is visible'.format(button.title()))
+        button_selectors = [VIDEO_BUTTONS[button] for button in video_player_buttons]
+
+        def _are_buttons_visible():
+            """
+            Check if all video player buttons are visible.
+
+            Returns:
+                bool: Tells if every element matched by each of the button selectors is visible.
+
+            """
+            # Same rules as WebElement.is_displayed(), which `wait_for_element_visibility` relies on:
+            # no `display: none` or zero opacity on the element or its ancestors, not `visibility: hidden`
+            # or `collapse`, and a non-empty box.
+            return self.browser.execute_script(
+                """
+                function isDisplayed(element) {
+                    var style = window.getComputedStyle(element);
+                    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+                        return false;
+                    }
+                    for (var node = element; node && node.nodeType === 1; node = node.parentNode) {
+                        style = window.getComputedStyle(node);
+                        if (style.display === 'none' || parseFloat(style.opacity) === 0) {
+                            return false;
+                        }
+                    }
+                    return Array.prototype.some.call(element.getClientRects(), function (rect) {
+                        return rect.width > 0 && rect.height > 0;
+                    });
+                }
+
+                return arguments[0].every(function (selector) {
+                    var elements = document.querySelectorAll(selector);
+                    return elements.length > 0 && Array.prototype.every.call(elements, isDisplayed);
+                });
+                """,
+                button_selectors
+            )
+
+        EmptyPromise(
+            _are_buttons_visible,
+            '{} buttons are visible'.format(', '.join(button.title() for button in video_player_buttons))
+        ).fulfill()
 
         def _is_finished_loading():
             """
@@ -103,24 +172,37 @@ class VideoPage(PageObject):
 
         self.wait_for_ajax()
 
-    def get_video_vertical_selector(self, video_display_name=None):
+    def _get_video_vertical_index(self, video_display_name=None):
         """
-        Get selector for a video vertical with display name specified by `video_display_name`.
+        Find index of a video vertical with display name specified by `video_display_name`.
 
         Arguments:
-            video_display_name (str or None): Display name of a Video. Default vertical selector if None.
+            video_display_name (str or None): Display name of a Video. Default vertical index if None.
 
         Returns:
-            str: Vertical Selector for video.
+            int: Vertical index for video.
 
         """
         if video_display_name:
             video_display_names = self.q(css=CSS_CLASS_NAMES['video_display_name']).text
             if video_display_name not in video_display_names:
                 raise ValueError("Incorrect Video Display Name: '{0}'".format(video_display_name))
-            return '.vert.vert-{}'.format(video_display_names.index(video_display_name))
+            return video_display_names.index(video_display_name)
         else:
-            return '.vert.vert-0'
+            return 0
+
+    def get_video_vertical_selector(self):
+        """
+        Get selector for the vertical of the current video.
+
+        The vertical index is resolved once by `use_video` or `reload_page`, so it is only valid for the
+        unit that was shown at that moment.
+
+        Returns:
+            str: Vertical Selector for video.
+
+        """
+        return '.vert.vert-{}'.format(self._vert_index)
 
     def get_element_selector(self, class_name):
         """
@@ -134,18 +216,24 @@ class VideoPage(PageObject):
 
         """
         return '{vertical} {video_element}'.format(
-            vertical=self.get_video_vertical_selector(self.current_video_display_name),
+            vertical=self.get_video_vertical_selector(),
             video_element=class_name)
 
     def use_video(self, video_display_name):
         """
         Set current video display name.
 
+        The vertical of the video and all element selectors are resolved here, against the unit that is
+        currently shown. After navigating to another unit (sequential), call `use_video` again, otherwise
+        the page keeps pointing at the vertical found on the previous unit.
+
         Arguments:
-            video_display_name (str): Display name of a Video.
+            video_display_name (str or None): Display name of a Video. The first video vertical if None.
 
         """
         self.current_video_display_name = video_display_name
+        self._vert_index = self._get_video_vertical_index(video_display_name)
+        self._sel = self._build_selectors()
 
     def is_video_rendered(self, mode):
         """
@@ -183,7 +271,7 @@ class VideoPage(PageObject):
             bool: Tells if autoplay enabled/disabled.
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['video_container'])
+        selector = self._sel['video_container']
         auto_play = self.q(css=selector).attrs('data-autoplay')[0]
 
         if auto_play.lower() == 'false':
@@ -200,7 +288,7 @@ class VideoPage(PageObject):
             bool: Tells about error message visibility.
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['error_message'])
+        selector = self._sel['error_message']
         return self.q(css=selector).visible
 
     @property
@@ -212,7 +300,7 @@ class VideoPage(PageObject):
             bool: Tells about spinner visibility.
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['video_spinner'])
+        selector = self._sel['video_spinner']
         return self.q(css=selector).visible
 
     @property
@@ -224,7 +312,7 @@ class VideoPage(PageObject):
             str: Error message text.
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['error_message'])
+        selector = self._sel['error_message']
         return self.q(css=selector).text[0]
 
     def is_button_shown(self, button_id):
@@ -238,7 +326,7 @@ class VideoPage(PageObject):
             bool: Tells about a buttons visibility.
 
         """
-        selector = self.get_element_selector(VIDEO_BUTTONS[button_id])
+        selector = self._sel['button.' + button_id]
         return self.q(css=selector).visible
 
     def show_captions(self):
@@ -265,7 +353,7 @@ class VideoPage(PageObject):
         states = {True: 'Shown', False: 'Hidden'}
         state = states[captions_new_state]
 
-        caption_state_selector = self.get_element_selector(CSS_CLASS_NAMES['closed_captions'])
+        caption_state_selector = self._sel['closed_captions']
 
         def _captions_current_state():
             """
@@ -299,10 +387,10 @@ class VideoPage(PageObject):
 
         """
         # wait until captions rendered completely
-        captions_rendered_selector = self.get_element_selector(CSS_CLASS_NAMES['captions_rendered'])
+        captions_rendered_selector = self._sel['captions_rendered']
         self.wait_for_element_presence(captions_rendered_selector, 'Captions Rendered')
 
-        captions_selector = self.get_element_selector(CSS_CLASS_NAMES['captions_text'])
+        captions_selector = self._sel['captions_text']
         subs = self.q(css=captions_selector).html
 
         return ' '.join(subs)
@@ -316,7 +404,7 @@ class VideoPage(PageObject):
             str: speed value
 
         """
-        speed_selector = self.get_element_selector(CSS_CLASS_NAMES['video_speed'])
+        speed_selector = self._sel['video_speed']
         return self.q(css=speed_selector).text[0]
 
     @speed.setter
@@ -329,7 +417,7 @@ class VideoPage(PageObject):
 
         """
         # mouse over to video speed button
-        speed_menu_selector = self.get_element_selector(VIDEO_BUTTONS['speed'])
+        speed_menu_selector = self._sel['button.speed']
         element_to_hover_over = self.q(css=speed_menu_selector).results[0]
         hover = ActionChains(self.browser).move_to_element(element_to_hover_over)
         hover.perform()
@@ -345,7 +433,7 @@ class VideoPage(PageObject):
             button (str): key in VIDEO_BUTTONS dictionary, its value will give us the css selector for `button`
 
         """
-        button_selector = self.get_element_selector(VIDEO_BUTTONS[button])
+        button_selector = self._sel['button.' + button]
         self.q(css=button_selector).first.click()
 
         button_states = {'play': 'playing', 'pause': 'pause'}
@@ -354,19 +442,27 @@ class VideoPage(PageObject):
 
         self.wait_for_ajax()
 
-    def _get_element_dimensions(self, selector):
+    def _batch_dimensions(self, *selectors):
         """
-        Gets the width and height of element specified by `selector`
+        Gets the width and height of elements specified by `selectors` in a single WebDriver call.
 
         Arguments:
-            selector (str): css selector of a web element
+            selectors (str): css selectors of web elements
 
         Returns:
-            dict: Dimensions of a web element.
+            list: Dimensions of web elements, in the same order as `selectors`.
 
         """
-        element = self.q(css=selector).results[0]
-        return element.size
+        # Round to integers, as WebElement.size does, so callers keep doing integer arithmetic.
+        return self.browser.execute_script(
+            """
+            return Array.prototype.map.call(arguments, function (selector) {
+                var rect = document.querySelector(selector).getBoundingClientRect();
+                return {width: Math.round(rect.width), height: Math.round(rect.height)};
+            });
+            """,
+            *selectors
+        )
 
     @property
     def _dimensions(self):
@@ -379,10 +475,10 @@ class VideoPage(PageObject):
         """
         iframe_selector = self.get_element_selector('.video-player iframe,')
         video_selector = self.get_element_selector(' .video-player video')
-        video = self._get_element_dimensions(iframe_selector + video_selector)
-        wrapper = self._get_element_dimensions(self.get_element_selector('.tc-wrapper'))
-        controls = self._get_element_dimensions(self.get_element_selector('.video-controls'))
-        progress_slider = self._get_element_dimensions(
+        video, wrapper, controls, progress_slider = self._batch_dimensions(
+            iframe_selector + video_selector,
+            self.get_element_selector('.tc-wrapper'),
+            self.get_element_selector('.video-controls'),
             self.get_element_selector('.video-controls > .slider'))
 
         expected = dict(wrapper)
@@ -390,6 +486,48 @@ class VideoPage(PageObject):
 
         return video, expected
 
+    def _resize_window(self, width, height):
+        """
+        Resize browser window and wait until the video player is re-aligned.
+
+        Arguments:
+            width (int): new window width.
+            height (int): new window height.
+
+        Returns:
+            tuple: Dimensions, as returned by `_dimensions`, after the player is re-aligned.
+
+        """
+        initial = self._dimensions
+        self.browser.set_window_size(width, height)
+
+        EmptyPromise(
+            lambda: self._dimensions != initial,
+            'Video player dimensions changed after resize to {0}x{1}'.format(width, height)
+        ).fulfill()
+
+        # The player re-aligns the video from a window `resize` handler debounced by 100 ms,
+        # so wait until the dimensions hold steady for longer than that.
+        last_seen = {'dimensions': None, 'since': None}
+
+        def _is_aligned_after_resize():
+            """
+            Check if video player dimensions did not change for 200 ms.
+
+            Returns:
+                tuple: (is_satisfied, result)`, where `is_satisfied` is a boolean indicating whether the promise was
+                satisfied, and `result` is the current video player dimensions.
+
+            """
+            dimensions = self._dimensions
+            now = time.time()
+            if dimensions != last_seen['dimensions']:
+                last_seen['dimensions'], last_seen['since'] = dimensions, now
+                return False, dimensions
+            return now - last_seen['since'] >= 0.2, dimensions
+
+        return Promise(_is_aligned_after_resize, 'Video player is re-aligned', try_interval=0.05).fulfill()
+
     def is_aligned(self, is_transcript_visible):
         """
         Check if video is aligned properly.
@@ -405,23 +543,11 @@ class VideoPage(PageObject):
         wrapper_width = 75 if is_transcript_visible else 100
         initial = self.browser.get_window_size()
 
-        self.browser.set_window_size(300, 600)
-
-        # Wait for browser to resize completely
-        # Currently there is no other way to wait instead of explicit wait
-        time.sleep(0.2)
-
-        real, expected = self._dimensions
+        real, expected = self._resize_window(300, 600)
 
         width = round(100 * real['width'] / expected['width']) == wrapper_width
 
-        self.browser.set_window_size(600, 300)
-
-        # Wait for browser to resize completely
-        # Currently there is no other way to wait instead of explicit wait
-        time.sleep(0.2)
-
-        real, expected = self._dimensions
+        real, expected = self._resize_window(600, 300)
 
         height = abs(expected['height'] - real['height']) <= 5
 
@@ -434,19 +560,30 @@ class VideoPage(PageObject):
 
     def _get_transcript(self, url):
         """
-        Download Transcript from `url`
+        Start downloading Transcript from `url`.
+
+        The body is not read, the caller is responsible for consuming and closing the response.
 
         """
-        kwargs = dict()
+        if self._http is None:
+            self._http = requests.Session()
 
-        session_id = [{i['name']: i['value']} for i in self.browser.get_cookies() if i['name'] == u'sessionid']
+        # Send only the browser's current session cookie, like a fresh request would. Drop a stale one
+        # after logout and anything picked up from previous transcript responses.
+        session_id = self.browser.get_cookie(u'sessionid')
+        self._http.cookies.clear()
         if session_id:
-            kwargs.update({
-                'cookies': session_id[0]
-            })
+            self._http.cookies.set('sessionid', session_id['value'])
+
+        return self._http.get(url, stream=True)
 
-        response = requests.get(url, **kwargs)
-        return response.status_code < 400, response.headers, response.content
+    def close_http_session(self):
+        """
+        Close the HTTP session used to download transcripts, if one was opened.
+        """
+        if self._http is not None:
+            self._http.close()
+            self._http = None
 
     def downloaded_transcript_contains_text(self, transcript_format, text_to_search):
         """
@@ -460,7 +597,7 @@ class VideoPage(PageObject):
             bool: Transcript download result.
 
         """
-        transcript_selector = self.get_element_selector(VIDEO_MENUS['transcript-format'])
+        transcript_selector = self._sel['menu.transcript-format']
 
         # check if we have a transcript with correct format
         if '.' + transcript_format not in self.q(css=transcript_selector).text[0]:
@@ -471,20 +608,38 @@ class VideoPage(PageObject):
             'txt': 'text/plain',
         }
 
-        transcript_url_selector = self.get_element_selector(VIDEO_BUTTONS['download_transcript'])
+        transcript_url_selector = self._sel['button.download_transcript']
         url = self.q(css=transcript_url_selector).attrs('href')[0]
-        result, headers, content = self._get_transcript(url)
+        response = self._get_transcript(url)
+        body_consumed = False
 
-        if result is False:
-            return False
+        try:
+            if response.status_code >= 400:
+                return False
 
-        if formats[transcript_format] not in headers.get('content-type', ''):
-            return False
+            if formats[transcript_format] not in response.headers.get('content-type', ''):
+                return False
 
-        if text_to_search not in content.decode('utf-8'):
-            return False
+            # Search the transcript chunk by chunk and stop downloading on the first match.
+            # The tail of the previous chunk is kept, so a match spanning two chunks is found too.
+            needle = text_to_search.encode('utf-8')
+            if not needle:
+                return True
 
-        return True
+            buf = b''
+            for chunk in response.iter_content(8192):
+                buf = buf[-len(needle):] + chunk
+                if needle in buf:
+                    return True
+
+            body_consumed = True
+            return False
+        finally:
+            # `Response.close` only releases the connection back to the pool. If the body was not read
+            # to the end, close the raw response first, so the unread data is not left on a pooled connection.
+            if not body_consumed:
+                response.raw.close()
+            response.close()
 
     def current_language(self):
         """
@@ -493,47 +648,70 @@ class VideoPage(PageObject):
         selector = self.get_element_selector(VIDEO_MENUS["language"] + ' li.is-active')
         return self.q(css=selector).first.attrs('data-lang-code')[0]
 
-    def select_language(self, code):
+    def _attempt_language_click(self, language_selector):
         """
-        Select captions for language `code`.
+        Open the language menu and click on the language item specified by `language_selector`.
 
         Arguments:
-            code (str): two character language code like `en`, `zh`.
+            language_selector (str): css selector of the language menu item.
 
         """
         self.wait_for_ajax()
 
         # mouse over to CC button
-        cc_button_selector = self.get_element_selector(VIDEO_BUTTONS["CC"])
+        cc_button_selector = self._sel['button.CC']
         element_to_hover_over = self.q(css=cc_button_selector).results[0]
         ActionChains(self.browser).move_to_element(element_to_hover_over).perform()
 
-        language_selector = VIDEO_MENUS["language"] + ' li[data-lang-code="{code}"]'.format(code=code)
-        language_selector = self.get_element_selector(language_selector)
         self.wait_for_element_visibility(language_selector, 'language menu is visible')
         self.q(css=language_selector).first.click()
 
+    def select_language(self, code):
+        """
+        Select captions for language `code`.
+
+        Arguments:
+            code (str): two character language code like `en`, `zh`.
+
+        """
+        language_selector = VIDEO_MENUS["language"] + ' li[data-lang-code="{code}"]'.format(code=code)
+        language_selector = self.get_element_selector(language_selector)
+        active_lang_selector = self.get_element_selector(VIDEO_MENUS["language"] + ' li.is-active')
+
         # Sometimes language is not clicked correctly. So, if the current language code
         # differs form the expected, we try to change it again.
-        if self.current_language() != code:
-            self.select_language(code)
+        for __ in range(3):
+            self._attempt_language_click(language_selector)
+            language_state = self.browser.execute_script(
+                """
+                var active = document.querySelectorAll(arguments[0]),
+                    language = document.querySelector(arguments[1]);
+                return {
+                    code: active.length ? active[0].getAttribute('data-lang-code') : null,
+                    cls: language ? language.className : '',
+                    count: active.length
+                };
+                """,
+                active_lang_selector, language_selector
+            )
+            if language_state['code'] == code:
+                break
 
-        if 'is-active' != self.q(css=language_selector).attrs('class')[0]:
+        if 'is-active' != language_state['cls']:
             return False
 
-        active_lang_selector = self.get_element_selector(VIDEO_MENUS["language"] + ' li.is-active')
-        if len(self.q(css=active_lang_selector).results) != 1:
+        if language_state['count'] != 1:
             return False
 
         # Make sure that all ajax requests that affects the display of captions are finished.
         # For example, request to get new translation etc.
         self.wait_for_ajax()
 
-        captions_selector = self.get_element_selector(CSS_CLASS_NAMES['captions'])
+        captions_selector = self._sel['captions']
         EmptyPromise(lambda: self.q(css=captions_selector).visible, 'Subtitles Visible').fulfill()
 
         # wait until captions rendered completely
-        captions_rendered_selector = self.get_element_selector(CSS_CLASS_NAMES['captions_rendered'])
+        captions_rendered_selector = self._sel['captions_rendered']
         self.wait_for_element_presence(captions_rendered_selector, 'Captions Rendered')
 
         return True
@@ -549,7 +727,7 @@ class VideoPage(PageObject):
             bool: Menu existence result
 
         """
-        selector = self.get_element_selector(VIDEO_MENUS[menu_name])
+        selector = self._sel['menu.' + menu_name]
         return self.q(css=selector).present
 
     def select_transcript_format(self, transcript_format):
@@ -563,7 +741,7 @@ class VideoPage(PageObject):
             bool: Selection Result.
 
         """
-        button_selector = self.get_element_selector(VIDEO_MENUS['transcript-format'])
+        button_selector = self._sel['menu.transcript-format']
 
         button = self.q(css=button_selector).results[0]
 
@@ -573,23 +751,46 @@ class VideoPage(PageObject):
         hover = ActionChains(self.browser).move_to_element(button)
         hover.perform()
 
-        if '...' not in self.q(css=button_selector).text[0]:
+        menu_selector = self._sel['menu.download_transcript']
+
+        # Get the button text together with the menu item for `transcript_format` in one go.
+        button_text, menu_item = self.browser.execute_script(
+            """
+            var button = document.querySelector(arguments[0]),
+                items = document.querySelectorAll(arguments[1]),
+                item = null;
+            for (var i = 0; i < items.length; i++) {
+                if (items[i].getAttribute('data-value') === arguments[2]) {
+                    item = items[i];
+                    break;
+                }
+            }
+            return [button ? button.textContent : '', item];
+            """,
+            button_selector, menu_selector + ' a', transcript_format
+        )
+
+        if '...' not in button_text:
             return False
 
-        menu_selector = self.get_element_selector(VIDEO_MENUS['download_transcript'])
-        menu_items = self.q(css=menu_selector + ' a').results
-        for item in menu_items:
-            if item.get_attribute('data-value') == transcript_format:
-                item.click()
-                self.wait_for_ajax()
-                break
+        if menu_item is not None:
+            menu_item.click()
+            self.wait_for_ajax()
 
-        self.browser.execute_script("window.scrollTo(0, 0);")
+        button_text, active_format = self.browser.execute_script(
+            """
+            window.scrollTo(0, 0);
+            var button = document.querySelector(arguments[0]),
+                active = document.querySelector(arguments[1]);
+            return [button ? button.textContent : '', active ? active.getAttribute('data-value') : ''];
+            """,
+            button_selector, menu_selector + ' .active a'
+        )
 
-        if self.q(css=menu_selector + ' .active a').attrs('data-value')[0] != transcript_format:
+        if active_format != transcript_format:
             return False
 
-        if '.' + transcript_format not in self.q(css=button_selector).text[0]:
+        if '.' + transcript_format not in button_text:
             return False
 
         return True
@@ -603,7 +804,7 @@ class VideoPage(PageObject):
             list: Video Source URLs.
 
         """
-        sources_selector = self.get_element_selector(CSS_CLASS_NAMES['video_sources'])
+        sources_selector = self._sel['video_sources']
         return self.q(css=sources_selector).map(lambda el: el.get_attribute('src').split('?')[0]).results
 
     @property
@@ -615,11 +816,31 @@ class VideoPage(PageObject):
             dict: Language Codes('en', 'zh' etc) as keys and Language Names as Values('English', 'Chinese' etc)
 
         """
-        languages_selector = self.get_element_selector(CSS_CLASS_NAMES['captions_lang_list'])
-        language_codes = self.q(css=languages_selector).attrs('data-lang-code')
-        language_names = self.q(css=languages_selector).attrs('textContent')
+        languages_selector = self._sel['captions_lang_list']
+        languages = self.browser.execute_script(
+            """
+            var items = document.querySelectorAll(arguments[0]);
+            return Array.prototype.map.call(items, function (item) {
+                return [item.getAttribute('data-lang-code'), item.textContent];
+            });
+            """,
+            languages_selector
+        )
 
-        return dict(zip(language_codes, language_names))
+        return dict(languages)
+
+    def _read_times(self):
+        """
+        Read elapsed time and duration from the video time display in one query.
+
+        Returns:
+            list: [elapsed, duration], both str in format min:sec. Only [''] while the time display is hidden.
+
+        """
+        # The full time has the form "0:32 / 3:14" elapsed/duration
+        all_times = self.q(css=self._sel['video_time']).text[0]
+
+        return [time_str.strip() for time_str in all_times.split('/')]
 
     @property
     def position(self):
@@ -630,9 +851,7 @@ class VideoPage(PageObject):
             str: current seek position in format min:sec.
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['video_time'])
-        current_seek_position = self.q(css=selector).text[0]
-        return current_seek_position.split('/')[0].strip()
+        return self._read_times()[0]
 
     @property
     def seconds(self):
@@ -643,7 +862,7 @@ class VideoPage(PageObject):
             str
 
         """
-        return int(self.position.split(':')[1])
+        return int(self._read_times()[0].split(':')[1])
 
     @property
     def state(self):
@@ -654,19 +873,20 @@ class VideoPage(PageObject):
             str: current video state
 
         """
-        state_selector = self.get_element_selector(CSS_CLASS_NAMES['video_container'])
-        current_state = self.q(css=state_selector).attrs('class')[0]
-
-        if 'is-playing' in current_state:
-            return 'playing'
-        elif 'is-paused' in current_state:
-            return 'pause'
-        elif 'is-buffered' in current_state:
-            return 'buffering'
-        elif 'is-ended' in current_state:
-            return 'finished'
+        # Map the container classes to a state in the browser, so each poll is a single cheap call.
+        return self.browser.execute_script(
+            """
+            var classes = document.querySelector(arguments[0]).classList;
+            if (classes.contains('is-playing')) { return 'playing'; }
+            if (classes.contains('is-paused')) { return 'pause'; }
+            if (classes.contains('is-buffered')) { return 'buffering'; }
+            if (classes.contains('is-ended')) { return 'finished'; }
+            return null;
+            """,
+            self._sel['video_container']
+        )
 
-    def _wait_for(self, check_func, desc, result=False, timeout=200):
+    def _wait_for(self, check_func, desc, result=False, timeout=200, try_interval=0.1):
         """
         Calls the method provided as an argument until the Promise satisfied or BrokenPromise
 
@@ -675,12 +895,13 @@ class VideoPage(PageObject):
             desc (str): Description of the Promise, used in log messages.
             result (bool): Indicates whether we need a results from Promise or not
             timeout (float): Maximum number of seconds to wait for the Promise to be satisfied before timing out.
+            try_interval (float): Number of seconds to wait between attempts.
 
         """
         if result:
-            return Promise(check_func, desc, timeout=timeout).fulfill()
+            return Promise(check_func, desc, timeout=timeout, try_interval=try_interval).fulfill()
         else:
-            return EmptyPromise(check_func, desc, timeout=timeout).fulfill()
+            return EmptyPromise(check_func, desc, timeout=timeout, try_interval=try_interval).fulfill()
 
     def wait_for_state(self, state):
         """
@@ -692,7 +913,8 @@ class VideoPage(PageObject):
         """
         self._wait_for(
             lambda: self.state == state,
-            'State is {state}'.format(state=state)
+            'State is {state}'.format(state=state),
+            try_interval=0.05
         )
 
     def _parse_time_str(self, time_str):
@@ -706,8 +928,11 @@ class VideoPage(PageObject):
             int: seek value in seconds
 
         """
-        time_obj = time.strptime(time_str, '%M:%S')
-        return time_obj.tm_min * 60 + time_obj.tm_sec
+        match = TIME_STR_RE.match(time_str)
+        if match is None:
+            raise ValueError("time data '{0}' does not match format '%M:%S'".format(time_str))
+        minutes, seconds = match.groups()
+        return int(minutes) * 60 + int(seconds)
 
     def seek(self, seek_value):
         """
@@ -739,6 +964,8 @@ class VideoPage(PageObject):
         """
         self.browser.refresh()
         self.wait_for_video_player_render()
+        self._vert_index = self._get_video_vertical_index(self.current_video_display_name)
+        self._sel = self._build_selectors()
 
     @property
     def duration(self):
@@ -749,14 +976,7 @@ class VideoPage(PageObject):
             str: duration in format min:sec
 
         """
-        selector = self.get_element_selector(CSS_CLASS_NAMES['video_time'])
-
-        # The full time has the form "0:32 / 3:14" elapsed/duration
-        all_times = self.q(css=selector).text[0]
-
-        duration_str = all_times.split('/')[1]
-
-        return duration_str.strip()
+        return self._read_times()[1]
 
     def wait_for_position(self, position):
         """
@@ -768,7 +988,8 @@ class VideoPage(PageObject):
         """
         self._wait_for(
             lambda: self.position == position,
-            'Position is {position}'.format(position=position)
+            'Position is {position}'.format(position=position),
+            try_interval=0.05
         )
 
     @property
@@ -780,7 +1001,7 @@ class VideoPage(PageObject):
             bool: visibility status
 
         """
-        selector = self.get_element_selector(VIDEO_BUTTONS['quality'])
+        selector = self._sel['button.quality']
         return self.q(css=selector).visible
 
     @property
@@ -792,7 +1013,7 @@ class VideoPage(PageObject):
             bool: active status
 
         """
-        selector = self.get_element_selector(VIDEO_BUTTONS['quality'])
+        selector = self._sel['button.quality']
 
         classes = self.q(css=selector).attrs('class')[0].split()
         return 'active' in classes
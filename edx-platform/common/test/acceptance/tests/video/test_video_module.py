@@ -53,6 +53,7 @@ class VideoBaseTest(UniqueCourseTest):
         super(VideoBaseTest, self).setUp()
 
         self.video = VideoPage(self.browser)
+        self.addCleanup(self.video.close_http_session)
         self.tab_nav = TabNavPage(self.browser)
         self.course_nav = CourseNavPage(self.browser)
         self.course_info_page = CourseInfoPage(self.browser, self.course_id)
@@ -223,13 +224,25 @@ class VideoBaseTest(UniqueCourseTest):
 
         return metadata
 
-    def go_to_sequential_position(self, position):
+    def go_to_sequential(self, sequential_title):
         """
-        Navigate to sequential specified by `video_display_name`
+        Navigate to sequential specified by `sequential_title` and use its first video.
+        """
+        self.course_nav.go_to_sequential(sequential_title)
+
+        # Video page selectors are resolved by `use_video`, so re-resolve them for the new unit.
+        self.video.use_video(None)
+
+    def go_to_sequential_position(self, position, video_display_name=None):
+        """
+        Navigate to sequential at `position` and use the video specified by `video_display_name`.
         """
         self.course_nav.go_to_sequential_position(position)
         self.video.wait_for_video_player_render()
 
+        # Video page selectors are resolved by `use_video`, so re-resolve them for the new unit.
+        self.video.use_video(video_display_name)
+
 
 class YouTubeVideoTest(VideoBaseTest):
     """ Test YouTube Video Player """
@@ -484,13 +497,13 @@ class YouTubeVideoTest(VideoBaseTest):
         self.assertTrue(self.video.downloaded_transcript_contains_text('txt', 'Hi, welcome to Edx.'))
 
         # open video "B"
-        self.course_nav.go_to_sequential('B')
+        self.go_to_sequential('B')
 
         # check if we can download transcript in "txt" format that has text "Equal transcripts"
         self.assertTrue(self.video.downloaded_transcript_contains_text('txt', 'Equal transcripts'))
 
         # open video "C"
-        self.course_nav.go_to_sequential('C')
+        self.go_to_sequential('C')
 
         # menu "download_transcript" doesn't exist
         self.assertFalse(self.video.is_menu_present('download_transcript'))
@@ -563,12 +576,12 @@ class YouTubeVideoTest(VideoBaseTest):
         execute_video_steps(tab1_video_names)
 
         # go to second sequential position
-        self.go_to_sequential_position(2)
+        self.go_to_sequential_position(2, tab2_video_names[0])
         execute_video_steps(tab2_video_names)
 
         # go back to first sequential position
         # we are again playing tab 1 videos to ensure that switching didn't broke some video functionality.
-        self.go_to_sequential_position(1)
+        self.go_to_sequential_position(1, tab1_video_names[0])
         execute_video_steps(tab1_video_names)
 
     def test_video_component_stores_speed_correctly_for_multiple_videos(self):
@@ -586,21 +599,21 @@ class YouTubeVideoTest(VideoBaseTest):
         self.navigate_to_video()
 
         # select the "2.0" speed on video "A"
-        self.course_nav.go_to_sequential('A')
+        self.go_to_sequential('A')
         self.video.speed = '2.0'
 
         # select the "0.50" speed on video "B"
-        self.course_nav.go_to_sequential('B')
+        self.go_to_sequential('B')
         self.video.speed = '0.50'
 
         # open video "C"
-        self.course_nav.go_to_sequential('C')
+        self.go_to_sequential('C')
 
         # check if video "C" should start playing at speed "0.75"
         self.assertEqual(self.video.speed, '0.75x')
 
         # open video "A"
-        self.course_nav.go_to_sequential('A')
+        self.go_to_sequential('A')
 
         # check if video "A" should start playing at speed "2.0"
         self.assertEqual(self.video.speed, '2.0x')
@@ -609,7 +622,7 @@ class YouTubeVideoTest(VideoBaseTest):
         self.video.reload_page()
 
         # open video "A"
-        self.course_nav.go_to_sequential('A')
+        self.go_to_sequential('A')
 
         # check if video "A" should start playing at speed "2.0"
         self.assertEqual(self.video.speed, '2.0x')
@@ -618,13 +631,13 @@ class YouTubeVideoTest(VideoBaseTest):
         self.video.speed = '1.0'
 
         # open video "B"
-        self.course_nav.go_to_sequential('B')
+        self.go_to_sequential('B')
 
         # check if video "B" should start playing at speed "0.50"
         self.assertEqual(self.video.speed, '0.50x')
 
         # open video "C"
-        self.course_nav.go_to_sequential('C')
+        self.go_to_sequential('C')
 
         # check if video "C" should start playing at speed "1.0"
         self.assertEqual(self.video.speed, '1.0x')